@@ -8,3 +8,18 @@ def event_loop_policy():
     """Use default event loop policy for all async tests."""
     import asyncio
     return asyncio.DefaultEventLoopPolicy()
+
+
+@pytest.fixture(scope="session")
+def client():
+    """
+    Provide one web API TestClient shared by the whole test session.
+
+    Deliberately not entered as a context manager: that would run the app
+    lifespan, which checks the database and starts the Discord bot.
+    """
+    from fastapi.testclient import TestClient
+
+    from main import app
+
+    return TestClient(app)
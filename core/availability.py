@@ -11,13 +11,13 @@ This ensures DST changes are handled correctly (user's "9am" stays 9am local).
 """
 
 import json
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Optional
 
 import pytz
 import cohort_scheduler
 
-from .constants import DAY_CODES, DAY_NAMES
+from .constants import DAY_CODES, DAY_INDEX, DAY_NAMES
 
 
 def get_dst_transitions(timezone_str: str, weeks_ahead: int = 12) -> list[datetime]:
@@ -74,9 +74,9 @@ def check_dst_warnings(
     warnings = []
     tz_transitions: dict[str, list[datetime]] = {}
 
-    for tz_str in set(timezones):
-        if not tz_str or tz_str == "UTC":
-            continue
+    # Dedupe and drop empty/UTC entries up front (UTC has no DST)
+    candidate_timezones = {tz_str for tz_str in timezones if tz_str and tz_str != "UTC"}
+    for tz_str in candidate_timezones:
         transitions = get_dst_transitions(tz_str, weeks_ahead)
         if transitions:
             tz_transitions[tz_str] = transitions
@@ -84,17 +84,16 @@ def check_dst_warnings(
     if not tz_transitions:
         return []
 
-    # Group timezones by transition date
-    date_to_timezones: dict[str, list[str]] = {}
+    # Group timezones by transition date (keyed on the date itself so that
+    # sorting is chronological and needs no key function)
+    date_to_timezones: dict[date, list[str]] = {}
     for tz_str, transitions in tz_transitions.items():
         for dt in transitions:
-            date_str = dt.strftime("%B %d, %Y")
-            if date_str not in date_to_timezones:
-                date_to_timezones[date_str] = []
-            date_to_timezones[date_str].append(tz_str)
+            date_to_timezones.setdefault(dt.date(), []).append(tz_str)
 
     # Generate warnings
-    for date_str, affected_tzs in sorted(date_to_timezones.items()):
+    for transition_date, affected_tzs in sorted(date_to_timezones.items()):
+        date_str = transition_date.strftime("%B %d, %Y")
         if len(affected_tzs) == 1:
             warnings.append(
                 f"DST transition on {date_str} for {affected_tzs[0]}. "
@@ -116,6 +115,39 @@ def check_dst_warnings(
 DAY_CODE_TO_NAME = {v: k for k, v in DAY_CODES.items()}
 
 
+def _get_timezone(timezone_str: str) -> pytz.BaseTzInfo:
+    """Resolve a timezone string, falling back to UTC if unknown."""
+    try:
+        return pytz.timezone(timezone_str)
+    except pytz.UnknownTimeZoneError:
+        return pytz.UTC
+
+
+def _local_time_to_utc(
+    day_name: str,
+    time_str: str,
+    tz: pytz.BaseTzInfo,
+) -> tuple[str, str]:
+    """Convert a local day/time to UTC using an already-resolved timezone."""
+    # Parse zero-padded "HH:MM" time
+    hour, minute = int(time_str[:2]), int(time_str[3:5])
+
+    # Map day to date (Jan 6, 2025 is Monday - using a recent date for accurate DST)
+    day_index = DAY_INDEX[day_name]
+
+    # Create local datetime
+    local_dt = tz.localize(datetime(2025, 1, 6 + day_index, hour, minute))
+
+    # Convert to UTC
+    utc_dt = local_dt.astimezone(pytz.UTC)
+
+    # Get UTC day and time
+    utc_day_code = DAY_CODES[DAY_NAMES[utc_dt.weekday()]]
+    utc_time_str = f"{utc_dt.hour:02d}:{utc_dt.minute:02d}"
+
+    return (utc_day_code, utc_time_str)
+
+
 def local_time_to_utc(
     day_name: str,
     time_str: str,
@@ -132,28 +164,25 @@ def local_time_to_utc(
     Returns:
         Tuple of (utc_day_code, utc_time_str) e.g., ("M", "14:30")
     """
-    try:
-        tz = pytz.timezone(timezone_str)
-    except pytz.UnknownTimeZoneError:
-        tz = pytz.UTC
-
-    # Parse time
-    hour, minute = map(int, time_str.split(":"))
+    return _local_time_to_utc(day_name, time_str, _get_timezone(timezone_str))
 
-    # Map day to date (Jan 6, 2025 is Monday - using a recent date for accurate DST)
-    day_index = DAY_NAMES.index(day_name)
 
-    # Create local datetime
-    local_dt = tz.localize(datetime(2025, 1, 6 + day_index, hour, minute))
-
-    # Convert to UTC
-    utc_dt = local_dt.astimezone(pytz.UTC)
+def local_times_to_utc(
+    times: list[tuple[str, str]],
+    timezone_str: str,
+) -> list[tuple[str, str]]:
+    """
+    Convert a batch of local day/times to UTC, resolving the timezone once.
 
-    # Get UTC day and time
-    utc_day_code = DAY_CODES[DAY_NAMES[utc_dt.weekday()]]
-    utc_time_str = f"{utc_dt.hour:02d}:{utc_dt.minute:02d}"
+    Args:
+        times: List of (day_name, "HH:MM") tuples in local time
+        timezone_str: Timezone string (e.g., "America/New_York")
 
-    return (utc_day_code, utc_time_str)
+    Returns:
+        List of (utc_day_code, utc_time_str) tuples, in the same order as times
+    """
+    tz = _get_timezone(timezone_str)
+    return [_local_time_to_utc(day, time_str, tz) for day, time_str in times]
 
 
 def merge_adjacent_slots(slots: list[str]) -> list[tuple[str, str]]:
@@ -170,12 +199,8 @@ def merge_adjacent_slots(slots: list[str]) -> list[tuple[str, str]]:
         return []
 
     # Parse slots into (start, end) tuples and sort by start time
-    parsed = []
-    for slot in slots:
-        start, end = slot.split("-")
-        parsed.append((start, end))
-
-    parsed.sort(key=lambda x: x[0])
+    # ("HH:MM" strings order correctly as plain tuples, no key function needed)
+    parsed = sorted(tuple(slot.split("-")) for slot in slots)
 
     # Merge adjacent slots
     merged = []
@@ -218,26 +243,28 @@ def availability_json_to_intervals(
     except json.JSONDecodeError:
         return []
 
-    interval_strs = []
-
+    # Merge adjacent slots in local time first, collecting every range endpoint
+    endpoints: list[tuple[str, str]] = []
     for day, slots in data.items():
         if not slots:
             continue
 
-        # Merge adjacent slots in local time first
-        merged = merge_adjacent_slots(slots)
+        for start_local, end_local in merge_adjacent_slots(slots):
+            endpoints.append((day, start_local))
+            endpoints.append((day, end_local))
 
-        for start_local, end_local in merged:
-            # Convert start and end times from local to UTC
-            start_day_code, start_utc = local_time_to_utc(
-                day, start_local, timezone_str
-            )
-            end_day_code, end_utc = local_time_to_utc(day, end_local, timezone_str)
+    if not endpoints:
+        return []
 
-            interval_strs.append(f"{start_day_code}{start_utc} {end_day_code}{end_utc}")
+    # Convert all endpoints from local to UTC in one batch
+    utc_endpoints = local_times_to_utc(endpoints, timezone_str)
 
-    if not interval_strs:
-        return []
+    interval_strs = [
+        f"{start_day_code}{start_utc} {end_day_code}{end_utc}"
+        for (start_day_code, start_utc), (end_day_code, end_utc) in zip(
+            utc_endpoints[::2], utc_endpoints[1::2]
+        )
+    ]
 
     return cohort_scheduler.parse_interval_string(", ".join(interval_strs))
 
@@ -7,10 +7,33 @@ from datetime import datetime
 from typing import Optional
 import pytz
 
+from .constants import DAY_INDEX, DAY_NAMES
 from .database import get_connection
 from .queries import users as user_queries
 from .timezone import utc_to_local_time
 
+# Bitmask with one bit per hour of the week (Monday 00:00 = bit 0)
+_ALL_WEEK_HOURS = (1 << (7 * 24)) - 1
+
+
+def _availability_mask(availability_str: str | None) -> int:
+    """
+    Encode an availability JSON string as an hour-of-week bitmask.
+
+    Bit (day_index * 24 + hour) is set for every slot, so overlap between
+    users is a single AND.
+    """
+    if not availability_str:
+        return 0
+
+    mask = 0
+    for day, slots in json.loads(availability_str).items():
+        day_offset = DAY_INDEX[day] * 24
+        for slot in slots:
+            # Slots are zero-padded "HH:MM-HH:MM" strings, so the hour is slot[:2]
+            mask |= 1 << (day_offset + int(slot[:2]))
+    return mask
+
 
 async def find_availability_overlap(
     member_ids: list[str],
@@ -23,8 +46,12 @@ async def find_availability_overlap(
 
     Returns:
         (day_name, hour) in UTC or None if no overlap found.
-        Prefers fully available slots over if-needed slots.
+        Prefers fully available slots over if-needed slots, and earlier
+        slots in the week over later ones.
     """
+    if not member_ids:
+        return None
+
     # Batch fetch all users from database
     async with get_connection() as conn:
         users = await user_queries.get_users_by_discord_ids(conn, member_ids)
@@ -32,57 +59,42 @@ async def find_availability_overlap(
     # Build lookup by discord_id
     user_by_id = {u["discord_id"]: u for u in users}
 
-    # Collect all availability
-    all_available = {}  # {(day, hour): [user_ids who are available]}
-    all_if_needed = {}  # {(day, hour): [user_ids who marked if-needed]}
+    # Intersect every member's availability as hour-of-week bitmasks
+    available_mask = _ALL_WEEK_HOURS
+    available_or_if_needed_mask = _ALL_WEEK_HOURS
 
     for member_id in member_ids:
         user = user_by_id.get(member_id)
         if not user:
-            continue
-
-        # Parse availability from JSON strings
-        availability_str = user.get("availability_local")
-        if_needed_str = user.get("if_needed_availability_local")
-
-        availability = json.loads(availability_str) if availability_str else {}
-        if_needed = json.loads(if_needed_str) if if_needed_str else {}
-
-        for day, slots in availability.items():
-            for slot in slots:
-                hour = int(slot.split(":")[0])
-                key = (day, hour)
-                if key not in all_available:
-                    all_available[key] = []
-                all_available[key].append(member_id)
-
-        for day, slots in if_needed.items():
-            for slot in slots:
-                hour = int(slot.split(":")[0])
-                key = (day, hour)
-                if key not in all_if_needed:
-                    all_if_needed[key] = []
-                all_if_needed[key].append(member_id)
-
-    member_id_set = set(member_ids)
-
-    # First pass: look for slots where everyone is fully available
-    for (day, hour), user_ids in all_available.items():
-        if set(user_ids) == member_id_set:
-            return (day, hour)
-
-    # Second pass: look for slots where everyone is available or if-needed
-    for day, hour in all_available.keys() | all_if_needed.keys():
-        available_ids = set(all_available.get((day, hour), []))
-        if_needed_ids = set(all_if_needed.get((day, hour), []))
-        combined = available_ids | if_needed_ids
-
-        if combined == member_id_set:
-            return (day, hour)
+            return None
+
+        available = _availability_mask(user.get("availability_local"))
+        if_needed = _availability_mask(user.get("if_needed_availability_local"))
+
+        available_mask &= available
+        available_or_if_needed_mask &= available | if_needed
+
+    # Prefer slots where everyone is fully available, then allow if-needed
+    for mask in (available_mask, available_or_if_needed_mask):
+        if mask:
+            slot = (mask & -mask).bit_length() - 1  # Lowest set bit
+            return (DAY_NAMES[slot // 24], slot % 24)
 
     return None
 
 
+def _format_12h(hour: int) -> str:
+    """Format an hour (0-24) as 12-hour time, e.g. 0 -> "12:00am", 15 -> "3:00pm"."""
+    suffix = "am" if hour % 24 < 12 else "pm"
+    return f"{hour % 12 or 12}:00{suffix}"
+
+
+# Static "3:00-4:00pm" labels for each local start hour, built once at import
+_HOUR_RANGE_LABELS = [
+    f"{_format_12h(hour)[:-2]}-{_format_12h(hour + 1)}" for hour in range(24)
+]
+
+
 def format_local_time(day: str, hour: int, tz_name: str) -> tuple[str, str]:
     """
     Convert UTC day/hour to local time string.
@@ -97,36 +109,8 @@ def format_local_time(day: str, hour: int, tz_name: str) -> tuple[str, str]:
         e.g., ("Wednesday", "Wednesdays 3:00-4:00pm EST")
     """
     local_day, local_hour = utc_to_local_time(day, hour, tz_name)
-
-    # Format hour as 12-hour time
-    if local_hour == 0:
-        start = "12:00am"
-        end = "1:00am"
-    elif local_hour < 12:
-        start = f"{local_hour}:00am"
-        end = f"{local_hour + 1}:00am" if local_hour + 1 < 12 else "12:00pm"
-    elif local_hour == 12:
-        start = "12:00pm"
-        end = "1:00pm"
-    else:
-        start = f"{local_hour - 12}:00pm"
-        end_hour = local_hour + 1
-        if end_hour == 24:
-            end = "12:00am"
-        elif end_hour > 12:
-            end = f"{end_hour - 12}:00pm"
-        else:
-            end = f"{end_hour}:00am"
-
-    time_str = f"{start[:-2]}-{end}"
-
-    # Get timezone abbreviation
-    try:
-        tz = pytz.timezone(tz_name)
-        now = datetime.now(pytz.UTC)
-        abbrev = now.astimezone(tz).strftime("%Z")
-    except pytz.UnknownTimeZoneError:
-        abbrev = tz_name
+    time_str = _HOUR_RANGE_LABELS[local_hour]
+    abbrev = get_timezone_abbrev(tz_name)
 
     return (local_day, f"{local_day}s {time_str} {abbrev}")
 
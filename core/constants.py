@@ -24,6 +24,9 @@ DAY_NAMES = [
     "Sunday",
 ]
 
+# Day name -> weekday index (Monday = 0), for O(1) ordering lookups
+DAY_INDEX = {day: i for i, day in enumerate(DAY_NAMES)}
+
 # Common timezones (max 25 for Discord select menu)
 TIMEZONES = [
     # Americas
@@ -2,10 +2,11 @@
 Data storage utilities for user and course data persistence.
 """
 
-import json
 import os
 from pathlib import Path
 
+import orjson
+
 # Data directory - can be overridden via DATA_DIR environment variable
 # Default: discord_bot/ directory (for backwards compatibility)
 _PROJECT_ROOT = Path(__file__).parent.parent
@@ -20,9 +21,9 @@ def load_data() -> dict:
     if not DATA_FILE.exists():
         return {}
     try:
-        with open(DATA_FILE, "r") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError) as e:
+        with open(DATA_FILE, "rb") as f:
+            return orjson.loads(f.read())
+    except (orjson.JSONDecodeError, IOError) as e:
         print(f"Warning: Failed to load data from {DATA_FILE}: {e}")
         return {}
 
@@ -31,8 +32,8 @@ def save_data(data: dict) -> None:
     """Save all user data to the JSON file."""
     DATA_DIR.mkdir(parents=True, exist_ok=True)
     try:
-        with open(DATA_FILE, "w") as f:
-            json.dump(data, f, indent=2)
+        with open(DATA_FILE, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
     except IOError as e:
         print(f"Error: Failed to save data to {DATA_FILE}: {e}")
         raise
@@ -59,9 +60,9 @@ def load_courses() -> dict:
     if not COURSES_FILE.exists():
         return {}
     try:
-        with open(COURSES_FILE, "r") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError) as e:
+        with open(COURSES_FILE, "rb") as f:
+            return orjson.loads(f.read())
+    except (orjson.JSONDecodeError, IOError) as e:
         print(f"Warning: Failed to load courses from {COURSES_FILE}: {e}")
         return {}
 
@@ -70,8 +71,8 @@ def save_courses(data: dict) -> None:
     """Save all course data to the JSON file."""
     DATA_DIR.mkdir(parents=True, exist_ok=True)
     try:
-        with open(COURSES_FILE, "w") as f:
-            json.dump(data, f, indent=2)
+        with open(COURSES_FILE, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
     except IOError as e:
         print(f"Error: Failed to save courses to {COURSES_FILE}: {e}")
         raise
@@ -48,11 +48,13 @@ def get_engine() -> AsyncEngine:
         _engine = create_async_engine(
             database_url,
             echo=os.environ.get("SQL_ECHO", "").lower() == "true",
-            # Connection pool settings
-            pool_size=5,
-            max_overflow=10,
-            pool_timeout=30,
-            pool_recycle=1800,  # Recycle connections every 30 minutes
+            # Connection pool settings (overridable per deployment, e.g. to fit
+            # the Supabase pooler's connection limit)
+            pool_size=int(os.environ.get("DB_POOL_SIZE", 5)),
+            max_overflow=int(os.environ.get("DB_MAX_OVERFLOW", 10)),
+            pool_timeout=int(os.environ.get("DB_POOL_TIMEOUT", 30)),
+            # Recycle connections every 30 minutes by default
+            pool_recycle=int(os.environ.get("DB_POOL_RECYCLE", 1800)),
             pool_pre_ping=True,  # Test connections before use
             # Disable prepared statement cache for Supabase pooler compatibility
             # (pgbouncer in transaction mode doesn't support prepared statements)
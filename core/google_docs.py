@@ -31,8 +31,20 @@ def make_tab_url(doc_url: str, tab_id: str) -> str:
     return f"https://docs.google.com/document/d/{doc_id}/edit?tab={tab_id}"
 
 
+# (access_token, expires_at) from the last successful token exchange
+_cached_token: tuple[str, float] | None = None
+
+
 async def _get_access_token() -> tuple[str | None, str | None]:
-    """Get OAuth2 access token using service account credentials."""
+    """
+    Get OAuth2 access token using service account credentials.
+
+    The token is minted on first use and reused until shortly before it expires.
+    """
+    global _cached_token
+    if _cached_token is not None and time.time() < _cached_token[1]:
+        return _cached_token[0], None
+
     if not CREDENTIALS_FILE.exists():
         return None, f"Service account file not found at {CREDENTIALS_FILE}"
     try:
@@ -60,6 +72,9 @@ async def _get_access_token() -> tuple[str | None, str | None]:
         ) as resp:
             data = await resp.json()
             if "access_token" in data:
+                # Refresh a minute early so in-flight requests don't use a stale token
+                expires_in = data.get("expires_in", 3600)
+                _cached_token = (data["access_token"], time.time() + expires_in - 60)
                 return data["access_token"], None
             return None, f"Token error: {data.get('error_description', data)}"
 
@@ -9,6 +9,7 @@ from .types import (
 )
 from .loader import (
     load_lesson,
+    load_lessons_bulk,
     get_available_lessons,
     LessonNotFoundError,
 )
@@ -24,6 +25,7 @@ from .content import (
     VideoTranscriptMetadata,
     get_stage_title,
     get_stage_duration,
+    get_stage_summaries,
 )
 from .sessions import (
     create_session,
@@ -41,6 +43,7 @@ from .chat import send_message as send_lesson_message, get_stage_content
 from .llm import DEFAULT_PROVIDER
 from .course_loader import (
     load_course,
+    reload_courses,
     get_next_lesson,
     get_all_lesson_slugs,
     get_lessons,
@@ -56,6 +59,7 @@ __all__ = [
     "Stage",
     "Lesson",
     "load_lesson",
+    "load_lessons_bulk",
     "get_available_lessons",
     "LessonNotFoundError",
     "load_article",
@@ -69,6 +73,7 @@ __all__ = [
     "VideoTranscriptMetadata",
     "get_stage_title",
     "get_stage_duration",
+    "get_stage_summaries",
     "create_session",
     "get_session",
     "get_user_sessions",
@@ -83,6 +88,7 @@ __all__ = [
     "get_stage_content",
     "DEFAULT_PROVIDER",
     "load_course",
+    "reload_courses",
     "get_next_lesson",
     "get_all_lesson_slugs",
     "get_lessons",
@@ -435,3 +435,26 @@ def get_stage_duration(stage) -> str:
 
     _duration_cache[cache_key] = duration
     return duration
+
+
+def get_stage_summaries(lesson) -> list[dict]:
+    """Summarize each stage of a lesson for course overviews.
+
+    Built fresh on every call so article and transcript edits show up
+    without touching the lesson YAML.
+
+    Args:
+        lesson: A Lesson object
+
+    Returns:
+        List of dicts with type, title, duration and optional per stage
+    """
+    return [
+        {
+            "type": stage.type,
+            "title": get_stage_title(stage),
+            "duration": get_stage_duration(stage) or None,
+            "optional": getattr(stage, "optional", False),
+        }
+        for stage in lesson.stages
+    ]
@@ -1,11 +1,12 @@
 # core/lessons/course_loader.py
 """Load course definitions from YAML files."""
 
+import functools
 import yaml
 from pathlib import Path
 
 from .types import Course, Module, LessonRef, Meeting
-from .loader import load_lesson, LessonNotFoundError
+from .loader import load_lesson, LessonNotFoundError, _load_lesson_file
 
 
 class CourseNotFoundError(Exception):
@@ -17,13 +18,13 @@ class CourseNotFoundError(Exception):
 COURSES_DIR = Path(__file__).parent.parent.parent / "educational_content" / "courses"
 
 
-def load_course(course_slug: str) -> Course:
-    """Load a course by slug from the courses directory."""
-    course_path = COURSES_DIR / f"{course_slug}.yaml"
-
-    if not course_path.exists():
-        raise CourseNotFoundError(f"Course not found: {course_slug}")
+@functools.lru_cache(maxsize=64)
+def _load_course_file(course_path: Path, mtime_ns: int) -> Course:
+    """Parse a course YAML file. Cached per path and mtime, see load_course().
 
+    mtime_ns is only part of the cache key: an edited file gets a new key and
+    is parsed again.
+    """
     with open(course_path) as f:
         data = yaml.safe_load(f)
 
@@ -47,6 +48,28 @@ def load_course(course_slug: str) -> Course:
     )
 
 
+def load_course(course_slug: str) -> Course:
+    """Load a course by slug from the courses directory.
+
+    Parsed courses are cached in-process by file modification time, so edits
+    to the YAML files are picked up on the next call.
+    """
+    course_path = COURSES_DIR / f"{course_slug}.yaml"
+
+    try:
+        mtime_ns = course_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise CourseNotFoundError(f"Course not found: {course_slug}")
+
+    return _load_course_file(course_path, mtime_ns)
+
+
+def reload_courses() -> None:
+    """Drop cached course and lesson definitions so they are re-read from disk."""
+    _load_course_file.cache_clear()
+    _load_lesson_file.cache_clear()
+
+
 def get_all_lesson_slugs(course_slug: str) -> list[str]:
     """Get flat list of all lesson slugs in course order."""
     course = load_course(course_slug)
@@ -64,11 +87,14 @@ def get_next_lesson(course_slug: str, current_lesson_slug: str) -> dict | None:
     course = load_course(course_slug)
 
     # Find the current lesson's index in progression
-    current_index = None
-    for i, item in enumerate(course.progression):
-        if isinstance(item, LessonRef) and item.slug == current_lesson_slug:
-            current_index = i
-            break
+    current_index = next(
+        (
+            i
+            for i, item in enumerate(course.progression)
+            if isinstance(item, LessonRef) and item.slug == current_lesson_slug
+        ),
+        None,
+    )
 
     if current_index is None:
         return None  # Lesson not in this course
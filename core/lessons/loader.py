@@ -1,6 +1,7 @@
 # core/lessons/loader.py
 """Load lesson definitions from YAML files."""
 
+import functools
 import yaml
 from pathlib import Path
 
@@ -77,10 +78,32 @@ def _parse_stage(data: dict) -> Stage:
         raise ValueError(f"Unknown stage type: {stage_type}")
 
 
+@functools.lru_cache(maxsize=1024)
+def _load_lesson_file(lesson_path: Path, mtime_ns: int) -> Lesson:
+    """Parse a lesson YAML file. Cached per path and mtime, see load_lesson().
+
+    mtime_ns is only part of the cache key: an edited file gets a new key and
+    is parsed again.
+    """
+    with open(lesson_path) as f:
+        data = yaml.safe_load(f)
+
+    stages = [_parse_stage(s) for s in data["stages"]]
+
+    return Lesson(
+        slug=data["slug"],
+        title=data["title"],
+        stages=stages,
+    )
+
+
 def load_lesson(lesson_slug: str) -> Lesson:
     """
     Load a lesson by slug from the lessons directory.
 
+    Parsed lessons are cached in-process by file modification time, so edits
+    to the YAML files are picked up on the next call.
+
     Args:
         lesson_slug: The lesson slug (filename without .yaml extension)
 
@@ -92,19 +115,31 @@ def load_lesson(lesson_slug: str) -> Lesson:
     """
     lesson_path = LESSONS_DIR / f"{lesson_slug}.yaml"
 
-    if not lesson_path.exists():
+    try:
+        mtime_ns = lesson_path.stat().st_mtime_ns
+    except FileNotFoundError:
         raise LessonNotFoundError(f"Lesson not found: {lesson_slug}")
 
-    with open(lesson_path) as f:
-        data = yaml.safe_load(f)
+    return _load_lesson_file(lesson_path, mtime_ns)
 
-    stages = [_parse_stage(s) for s in data["stages"]]
 
-    return Lesson(
-        slug=data["slug"],
-        title=data["title"],
-        stages=stages,
-    )
+def load_lessons_bulk(lesson_slugs: list[str]) -> dict[str, Lesson]:
+    """
+    Load several lessons in one call.
+
+    Args:
+        lesson_slugs: Lesson slugs to load (duplicates are loaded once)
+
+    Returns:
+        Dict mapping slug to Lesson. Slugs with no lesson file are omitted.
+    """
+    lessons = {}
+    for slug in dict.fromkeys(lesson_slugs):
+        try:
+            lessons[slug] = load_lesson(slug)
+        except LessonNotFoundError:
+            continue
+    return lessons
 
 
 def get_available_lessons() -> list[str]:
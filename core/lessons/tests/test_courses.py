@@ -177,3 +177,27 @@ def test_load_course_parses_progression_types(patch_all_dirs):
     # Check meetings
     assert meetings[0].number == 1
     assert meetings[1].number == 2
+
+
+def test_load_course_reparses_after_file_changes(monkeypatch, tmp_path):
+    """load_course should reuse the parsed course until the YAML file changes."""
+    import os
+    import core.lessons.course_loader as course_loader_module
+
+    monkeypatch.setattr(course_loader_module, "COURSES_DIR", tmp_path)
+    course_file = tmp_path / "edited-course.yaml"
+    course_file.write_text(
+        "slug: edited-course\ntitle: Before\nprogression:\n  - lesson: lesson-a\n"
+    )
+
+    course = load_course("edited-course")
+    assert load_course("edited-course") is course
+
+    course_file.write_text(
+        "slug: edited-course\ntitle: After\nprogression:\n  - lesson: lesson-a\n"
+    )
+    # Bump the mtime explicitly; coarse filesystem clocks may not change it
+    stat = course_file.stat()
+    os.utime(course_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert load_course("edited-course").title == "After"
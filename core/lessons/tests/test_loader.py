@@ -7,6 +7,7 @@ These tests use fixtures to test the loading logic without depending on real con
 import pytest
 from core.lessons.loader import (
     load_lesson,
+    load_lessons_bulk,
     get_available_lessons,
     LessonNotFoundError,
 )
@@ -44,3 +45,60 @@ def test_parse_optional_stages(patch_lessons_dir):
     assert lesson.stages[1].optional is True   # explicit article
     assert lesson.stages[2].optional is True   # explicit video
     assert not hasattr(lesson.stages[3], "optional")  # chat has no optional
+
+
+def test_load_lessons_bulk_skips_missing(patch_lessons_dir):
+    """Should return found lessons keyed by slug and omit unknown slugs."""
+    lessons = load_lessons_bulk(["test-basic", "nonexistent-lesson", "test-basic"])
+
+    assert list(lessons) == ["test-basic"]
+    assert lessons["test-basic"].title == "Test Basic Lesson"
+
+
+def test_load_lesson_is_cached_until_reload(patch_lessons_dir):
+    """Should reuse the parsed lesson until reload_courses() clears the cache."""
+    from core.lessons.course_loader import reload_courses
+
+    lesson = load_lesson("test-basic")
+    assert load_lesson("test-basic") is lesson
+
+    reload_courses()
+    assert load_lesson("test-basic") is not lesson
+
+
+def test_load_lesson_reparses_after_file_changes(monkeypatch, tmp_path):
+    """Should return the new content once the lesson YAML file changes."""
+    import os
+    import core.lessons.loader as loader_module
+
+    monkeypatch.setattr(loader_module, "LESSONS_DIR", tmp_path)
+    lesson_file = tmp_path / "edited-lesson.yaml"
+    lesson_file.write_text(
+        "slug: edited-lesson\ntitle: Before\nstages:\n"
+        "  - type: chat\n    instructions: Hi\n"
+    )
+
+    lesson = load_lesson("edited-lesson")
+    assert load_lesson("edited-lesson") is lesson
+
+    lesson_file.write_text(
+        "slug: edited-lesson\ntitle: After\nstages:\n"
+        "  - type: chat\n    instructions: Hi\n"
+    )
+    # Bump the mtime explicitly; coarse filesystem clocks may not change it
+    stat = lesson_file.stat()
+    os.utime(lesson_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert load_lesson("edited-lesson").title == "After"
+
+
+def test_get_stage_summaries(patch_lessons_dir):
+    """Should summarize each stage, building a new list on every call."""
+    from core.lessons.content import get_stage_summaries
+
+    lesson = load_lesson("test-basic")
+
+    summaries = get_stage_summaries(lesson)
+    assert [s["type"] for s in summaries] == ["article", "chat"]
+    assert summaries[1]["title"] == "Discussion"
+    assert get_stage_summaries(lesson) is not summaries
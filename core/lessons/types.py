@@ -1,12 +1,15 @@
 """
 Type definitions for lesson stages and sessions.
+
+Lesson and course definitions are frozen because the loaders cache them and
+share the same instances across requests.
 """
 
 from dataclasses import dataclass
 from typing import Literal
 
 
-@dataclass
+@dataclass(frozen=True)
 class ArticleStage:
     """Display a section of a markdown article."""
 
@@ -21,7 +24,7 @@ class ArticleStage:
     introduction: str | None = None  # Lens Academy intro note
 
 
-@dataclass
+@dataclass(frozen=True)
 class VideoStage:
     """Display a YouTube video clip."""
 
@@ -33,7 +36,7 @@ class VideoStage:
     introduction: str | None = None  # Lens Academy intro note
 
 
-@dataclass
+@dataclass(frozen=True)
 class ChatStage:
     """Active discussion with AI tutor."""
 
@@ -48,7 +51,7 @@ class ChatStage:
 Stage = ArticleStage | VideoStage | ChatStage
 
 
-@dataclass
+@dataclass(frozen=True)
 class Lesson:
     """A complete lesson definition."""
 
@@ -57,7 +60,7 @@ class Lesson:
     stages: list[Stage]
 
 
-@dataclass
+@dataclass(frozen=True)
 class LessonRef:
     """Reference to a lesson in a course progression."""
 
@@ -65,7 +68,7 @@ class LessonRef:
     optional: bool = False
 
 
-@dataclass
+@dataclass(frozen=True)
 class Meeting:
     """A meeting marker in the course progression."""
 
@@ -75,7 +78,7 @@ class Meeting:
 ProgressionItem = LessonRef | Meeting
 
 
-@dataclass
+@dataclass(frozen=True)
 class Course:
     """A complete course definition."""
 
@@ -2,6 +2,8 @@
 Notification dispatcher - routes messages to channels based on user preferences.
 """
 
+import asyncio
+
 from core.notifications.templates import get_message, load_templates
 from core.notifications.channels.email import send_email
 from core.notifications.channels.discord import (
@@ -103,7 +105,9 @@ async def send_notification(
         if "email_subject" in message_templates and "email_body" in message_templates:
             subject = get_message(message_type, "email_subject", full_context)
             body = get_message(message_type, "email_body", full_context)
-            result["email"] = send_email(
+            # SendGrid's client is blocking; keep it off the shared event loop
+            result["email"] = await asyncio.to_thread(
+                send_email,
                 to_email=user["email"],
                 subject=subject,
                 body=body,
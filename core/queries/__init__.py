@@ -18,6 +18,10 @@ from .groups import (
 from .facilitator import (
     is_admin,
     get_facilitator_group_ids,
+    get_auth_bundle,
+    get_cached_auth_bundle,
+    clear_auth_cache,
+    clearing_auth_cache,
     get_accessible_groups,
     can_access_group,
 )
@@ -59,6 +63,10 @@ __all__ = [
     # Facilitator
     "is_admin",
     "get_facilitator_group_ids",
+    "get_auth_bundle",
+    "get_cached_auth_bundle",
+    "clear_auth_cache",
+    "clearing_auth_cache",
     "get_accessible_groups",
     "can_access_group",
     # Progress
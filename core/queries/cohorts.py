@@ -146,7 +146,8 @@ async def get_available_cohorts(
     result = await conn.execute(query)
     all_cohorts = [dict(row) for row in result.mappings()]
 
-    if not user_id:
+    # Nothing to split if there are no upcoming cohorts; skip the signups query
+    if not user_id or not all_cohorts:
         return {"enrolled": [], "available": all_cohorts}
 
     # Get user's signups (pending enrollments)
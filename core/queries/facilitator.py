@@ -1,8 +1,10 @@
 """Queries for facilitator panel access control."""
 
-from typing import Any
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncConnection
 
 from ..tables import groups, groups_users, users, cohorts
@@ -29,15 +31,113 @@ async def get_facilitator_group_ids(conn: AsyncConnection, user_id: int) -> list
     return [row.group_id for row in result]
 
 
+async def get_auth_bundle(
+    conn: AsyncConnection, discord_id: str
+) -> dict[str, Any] | None:
+    """
+    Get everything needed for a facilitator access check in one query.
+
+    Combines the user lookup, is_admin() and get_facilitator_group_ids().
+
+    Returns:
+        Dict with user_id, is_admin and group_ids, or None if no user has
+        this discord_id.
+    """
+    facilitator_group_ids = (
+        select(func.array_agg(groups_users.c.group_id))
+        .where(
+            (groups_users.c.user_id == users.c.user_id)
+            & (groups_users.c.role == "facilitator")
+            & (groups_users.c.status == "active")
+        )
+        .scalar_subquery()
+    )
+    result = await conn.execute(
+        select(
+            users.c.user_id,
+            users.c.is_admin,
+            facilitator_group_ids.label("group_ids"),
+        ).where(users.c.discord_id == discord_id)
+    )
+    row = result.first()
+    if row is None:
+        return None
+
+    return {
+        "user_id": row.user_id,
+        "is_admin": row.is_admin is True,
+        "group_ids": list(row.group_ids or []),
+    }
+
+
+# Seconds a cached auth bundle stays valid. Facilitator grants made through
+# add_user_to_group() clear the cache, but nothing in the app removes
+# facilitators or revokes admin: those changes are made directly in the
+# database, so a revoked user keeps facilitator-panel access for up to this long.
+AUTH_CACHE_TTL = 60.0
+
+# discord_id -> (expires_at on the monotonic clock, auth bundle)
+_auth_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+
+
+async def get_cached_auth_bundle(
+    conn: AsyncConnection, discord_id: str
+) -> dict[str, Any] | None:
+    """
+    get_auth_bundle() with a short per-discord_id TTL cache.
+
+    Unknown users are not cached, so a newly created user is seen at once.
+    """
+    now = time.monotonic()
+    cached = _auth_cache.get(discord_id)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
+    bundle = await get_auth_bundle(conn, discord_id)
+    if bundle is not None:
+        _auth_cache[discord_id] = (now + AUTH_CACHE_TTL, bundle)
+    return bundle
+
+
+def clear_auth_cache() -> None:
+    """Drop all cached auth bundles, e.g. after facilitator roles change."""
+    _auth_cache.clear()
+
+
+@asynccontextmanager
+async def clearing_auth_cache() -> AsyncIterator[None]:
+    """
+    Clear the auth cache on exit.
+
+    Enter it before the transaction that changes roles, e.g.
+    `async with clearing_auth_cache(), get_transaction() as conn:`, so the
+    clear runs after commit. A bundle cached by a concurrent request while
+    the transaction was still open is then dropped too.
+    """
+    try:
+        yield
+    finally:
+        clear_auth_cache()
+
+
 async def get_accessible_groups(
-    conn: AsyncConnection, user_id: int
+    conn: AsyncConnection,
+    user_id: int,
+    *,
+    admin: bool | None = None,
+    group_ids: list[int] | None = None,
 ) -> list[dict[str, Any]]:
     """
     Get groups accessible to this user.
 
     Admins see all groups, facilitators see only their groups.
+
+    Args:
+        admin: The user's admin flag, if already known (skips the lookup)
+        group_ids: The user's facilitator group IDs, if already known
     """
-    admin = await is_admin(conn, user_id)
+    if admin is None:
+        admin = await is_admin(conn, user_id)
 
     query = (
         select(
@@ -55,7 +155,8 @@ async def get_accessible_groups(
 
     if not admin:
         # Facilitators only see their groups
-        group_ids = await get_facilitator_group_ids(conn, user_id)
+        if group_ids is None:
+            group_ids = await get_facilitator_group_ids(conn, user_id)
         if not group_ids:
             return []
         query = query.where(groups.c.group_id.in_(group_ids))
@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncConnection
 
 from ..lessons.course_loader import load_course
 from ..tables import cohorts, groups, groups_users, users
+from .facilitator import clear_auth_cache
 
 
 async def create_group(
@@ -55,6 +56,10 @@ async def add_user_to_group(
         )
         .returning(groups_users)
     )
+    if role == "facilitator":
+        # Facilitator group membership feeds the cached facilitator auth check.
+        # Callers should also clear after commit, see clearing_auth_cache().
+        clear_auth_cache()
     row = result.mappings().first()
     return dict(row)
 
@@ -204,6 +204,25 @@ async def get_user_chat_sessions(
 
     Returns lesson_sessions with messages, ordered by most recent.
     """
+    # Subquery: count chat heartbeats per session (one query, not one per session)
+    heartbeat_counts = (
+        select(
+            content_events.c.session_id,
+            func.count(content_events.c.event_id).label("heartbeat_count"),
+        )
+        .where(
+            content_events.c.session_id.in_(
+                select(lesson_sessions.c.session_id).where(
+                    lesson_sessions.c.user_id == user_id
+                )
+            )
+            & (content_events.c.stage_type == "chat")
+            & (content_events.c.event_type == ContentEventType.heartbeat)
+        )
+        .group_by(content_events.c.session_id)
+        .subquery()
+    )
+
     result = await conn.execute(
         select(
             lesson_sessions.c.session_id,
@@ -212,6 +231,13 @@ async def get_user_chat_sessions(
             lesson_sessions.c.started_at,
             lesson_sessions.c.completed_at,
             lesson_sessions.c.last_active_at,
+            func.coalesce(heartbeat_counts.c.heartbeat_count, 0).label(
+                "heartbeat_count"
+            ),
+        )
+        .outerjoin(
+            heartbeat_counts,
+            lesson_sessions.c.session_id == heartbeat_counts.c.session_id,
         )
         .where(lesson_sessions.c.user_id == user_id)
         .order_by(lesson_sessions.c.last_active_at.desc())
@@ -219,16 +245,6 @@ async def get_user_chat_sessions(
 
     sessions = []
     for row in result.mappings():
-        # Calculate duration from heartbeats
-        duration_result = await conn.execute(
-            select(func.count(content_events.c.event_id)).where(
-                (content_events.c.session_id == row["session_id"])
-                & (content_events.c.stage_type == "chat")
-                & (content_events.c.event_type == ContentEventType.heartbeat)
-            )
-        )
-        heartbeat_count = duration_result.scalar() or 0
-
         sessions.append(
             {
                 "session_id": row["session_id"],
@@ -240,7 +256,7 @@ async def get_user_chat_sessions(
                 "completed_at": row["completed_at"].isoformat()
                 if row["completed_at"]
                 else None,
-                "duration_seconds": heartbeat_count * HEARTBEAT_INTERVAL_SECONDS,
+                "duration_seconds": row["heartbeat_count"] * HEARTBEAT_INTERVAL_SECONDS,
             }
         )
 
@@ -8,11 +8,6 @@ from datetime import date, timedelta
 
 from sqlalchemy import insert
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from sqlalchemy import update
 
 from core.tables import (
@@ -27,6 +22,10 @@ from core.enums import GroupUserRole, GroupUserStatus, StageType, ContentEventTy
 from core.queries.facilitator import (
     is_admin,
     get_facilitator_group_ids,
+    get_auth_bundle,
+    get_cached_auth_bundle,
+    clear_auth_cache,
+    clearing_auth_cache,
     get_accessible_groups,
     can_access_group,
 )
@@ -247,6 +246,111 @@ class TestGetFacilitatorGroupIds:
         assert result == [fac_group["group_id"]]
 
 
+class TestGetAuthBundle:
+    """Tests for get_auth_bundle query."""
+
+    @pytest.mark.asyncio
+    async def test_returns_none_for_unknown_discord_id(self, db_conn):
+        """Unknown discord_id should return None."""
+        result = await get_auth_bundle(db_conn, "nonexistent_discord_id")
+
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_regular_user_has_no_access(self, db_conn):
+        """Regular user should be non-admin with no groups."""
+        user = await create_test_user(db_conn, "bundle_regular_user")
+
+        result = await get_auth_bundle(db_conn, "bundle_regular_user")
+
+        assert result == {
+            "user_id": user["user_id"],
+            "is_admin": False,
+            "group_ids": [],
+        }
+
+    @pytest.mark.asyncio
+    async def test_returns_admin_flag_and_facilitator_groups(self, db_conn):
+        """Should match is_admin and get_facilitator_group_ids."""
+        user = await create_test_user(db_conn, "bundle_admin_fac")
+        await make_admin(db_conn, user["user_id"])
+        cohort = await create_test_cohort(db_conn)
+        fac_group = await create_test_group(db_conn, cohort["cohort_id"], "Fac")
+        part_group = await create_test_group(db_conn, cohort["cohort_id"], "Part")
+        await add_user_to_group(
+            db_conn, user["user_id"], fac_group["group_id"], "facilitator"
+        )
+        await add_user_to_group(
+            db_conn, user["user_id"], part_group["group_id"], "participant"
+        )
+
+        result = await get_auth_bundle(db_conn, "bundle_admin_fac")
+
+        assert result["is_admin"] is True
+        assert result["group_ids"] == [fac_group["group_id"]]
+
+
+class TestGetCachedAuthBundle:
+    """Tests for get_cached_auth_bundle TTL cache."""
+
+    @pytest.fixture(autouse=True)
+    def empty_auth_cache(self):
+        """Start each test with an empty auth cache and leave none behind."""
+        clear_auth_cache()
+        yield
+        clear_auth_cache()
+
+    @pytest.mark.asyncio
+    async def test_reuses_bundle_until_cleared(self, db_conn):
+        """Should serve the cached bundle until clear_auth_cache() is called."""
+        user = await create_test_user(db_conn, "cached_bundle_user")
+
+        first = await get_cached_auth_bundle(db_conn, "cached_bundle_user")
+        await make_admin(db_conn, user["user_id"])
+        cached = await get_cached_auth_bundle(db_conn, "cached_bundle_user")
+
+        assert cached["is_admin"] is False
+        assert cached is first
+
+        clear_auth_cache()
+        refreshed = await get_cached_auth_bundle(db_conn, "cached_bundle_user")
+
+        assert refreshed["is_admin"] is True
+
+    @pytest.mark.asyncio
+    async def test_facilitator_grant_drops_cached_bundle(self, db_conn):
+        """add_user_to_group(..., "facilitator") should invalidate the cache."""
+        from core.queries.groups import add_user_to_group as add_group_member
+
+        user = await create_test_user(db_conn, "granted_fac_user")
+        cohort = await create_test_cohort(db_conn)
+        group = await create_test_group(db_conn, cohort["cohort_id"])
+
+        before = await get_cached_auth_bundle(db_conn, "granted_fac_user")
+        assert before["group_ids"] == []
+
+        await add_group_member(
+            db_conn, group["group_id"], user["user_id"], "facilitator"
+        )
+        after = await get_cached_auth_bundle(db_conn, "granted_fac_user")
+
+        assert after["group_ids"] == [group["group_id"]]
+
+    @pytest.mark.asyncio
+    async def test_clearing_auth_cache_clears_on_exit(self, db_conn):
+        """Bundles cached inside the block should be dropped when it exits."""
+        user = await create_test_user(db_conn, "cleared_on_exit_user")
+
+        async with clearing_auth_cache():
+            first = await get_cached_auth_bundle(db_conn, "cleared_on_exit_user")
+            await make_admin(db_conn, user["user_id"])
+
+        refreshed = await get_cached_auth_bundle(db_conn, "cleared_on_exit_user")
+
+        assert first["is_admin"] is False
+        assert refreshed["is_admin"] is True
+
+
 class TestCanAccessGroup:
     """Tests for can_access_group query."""
 
@@ -534,3 +638,44 @@ class TestGetUserChatSessions:
         assert result[0]["lesson_slug"] == "chat-lesson"
         assert len(result[0]["messages"]) == 2
         assert result[0]["messages"][0]["content"] == "Hello"
+
+    @pytest.mark.asyncio
+    async def test_duration_counts_chat_heartbeats_per_session(self, db_conn):
+        """Each session's duration should come from its own chat heartbeats."""
+        from core.queries.progress import HEARTBEAT_INTERVAL_SECONDS
+
+        user = await create_test_user(db_conn, "chat_duration_user")
+        cohort = await create_test_cohort(db_conn)
+        group = await create_test_group(db_conn, cohort["cohort_id"])
+
+        busy = await create_lesson_session(db_conn, user["user_id"], "busy-lesson")
+        brief = await create_lesson_session(db_conn, user["user_id"], "brief-lesson")
+        idle = await create_lesson_session(db_conn, user["user_id"], "idle-lesson")
+
+        for _ in range(3):
+            await create_heartbeat(
+                db_conn,
+                user["user_id"],
+                busy["session_id"],
+                "busy-lesson",
+                0,
+                "chat",
+            )
+        # Non-chat heartbeats don't count toward chat duration
+        await create_heartbeat(
+            db_conn, user["user_id"], busy["session_id"], "busy-lesson", 1, "article"
+        )
+        await create_heartbeat(
+            db_conn, user["user_id"], brief["session_id"], "brief-lesson", 0, "chat"
+        )
+
+        result = await get_user_chat_sessions(
+            db_conn, user["user_id"], group["group_id"]
+        )
+        durations = {s["session_id"]: s["duration_seconds"] for s in result}
+
+        assert durations == {
+            busy["session_id"]: 3 * HEARTBEAT_INTERVAL_SECONDS,
+            brief["session_id"]: HEARTBEAT_INTERVAL_SECONDS,
+            idle["session_id"]: 0,  # No heartbeats: outer join yields NULL
+        }
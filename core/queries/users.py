@@ -248,18 +248,21 @@ async def is_facilitator_by_user_id(
 async def toggle_facilitator(
     conn: AsyncConnection,
     discord_id: str,
+    user_id: int | None = None,
 ) -> bool:
     """
     Toggle a user's facilitator status.
 
+    Pass user_id if the caller has already loaded the user, to skip the lookup.
+
     Returns the new facilitator status (True if now a facilitator, False if removed).
     Returns False if user doesn't exist.
     """
-    user = await get_user_by_discord_id(conn, discord_id)
-    if not user:
-        return False
-
-    user_id = user["user_id"]
+    if user_id is None:
+        user = await get_user_by_discord_id(conn, discord_id)
+        if not user:
+            return False
+        user_id = user["user_id"]
 
     # Check if already a facilitator
     result = await conn.execute(
@@ -4,6 +4,7 @@ Cohort Scheduling - Database-backed scheduling using cohort_scheduler package.
 Main entry point: schedule_cohort() - loads users from DB, runs scheduling, persists results.
 """
 
+import asyncio
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -15,6 +16,7 @@ from .availability import availability_json_to_intervals, check_dst_warnings
 from .database import get_transaction
 from .enums import UngroupableReason as DBUngroupableReason
 from .queries.cohorts import get_cohort_by_id
+from .queries.facilitator import clearing_auth_cache
 from .queries.groups import create_group, add_user_to_group
 from .tables import signups, users, facilitators
 
@@ -260,6 +262,53 @@ def analyze_ungroupable_users(
     return details
 
 
+def _build_people(
+    user_rows: list[dict],
+) -> tuple[list[Person], dict[str, int], set[str], list[str]]:
+    """
+    Convert signup rows into scheduler Person objects.
+
+    Returns:
+        (people, discord_id -> user_id map, facilitator discord_ids, user timezones)
+    """
+    people = []
+    user_id_map = {}  # discord_id -> user_id for later
+    facilitator_ids = set()
+    user_timezones = []  # Collect for DST warning check
+
+    for row in user_rows:
+        discord_id = row["discord_id"]
+        user_id_map[discord_id] = row["user_id"]
+        user_timezone = row["timezone"] or "UTC"
+
+        # Parse availability from JSON format, converting from local to UTC
+        intervals = availability_json_to_intervals(
+            row["availability_local"], user_timezone
+        )
+        if_needed = availability_json_to_intervals(
+            row["if_needed_availability_local"], user_timezone
+        )
+
+        if not intervals and not if_needed:
+            continue  # Skip users with no availability
+
+        name = row["nickname"] or row["discord_username"] or f"User {row['user_id']}"
+        person = Person(
+            id=discord_id,
+            name=name,
+            intervals=intervals,
+            if_needed_intervals=if_needed,
+            timezone=user_timezone,
+        )
+        people.append(person)
+        user_timezones.append(user_timezone)
+
+        if row["role"] == "facilitator":
+            facilitator_ids.add(discord_id)
+
+    return people, user_id_map, facilitator_ids, user_timezones
+
+
 async def schedule_cohort(
     cohort_id: int,
     meeting_length: int = 60,
@@ -282,7 +331,9 @@ async def schedule_cohort(
 
     Returns: CohortSchedulingResult with summary
     """
-    async with get_transaction() as conn:
+    # New facilitator memberships must reach the facilitator auth cache once
+    # committed, so clear it after the transaction closes
+    async with clearing_auth_cache(), get_transaction() as conn:
         # Get cohort info
         cohort = await get_cohort_by_id(conn, cohort_id)
         if not cohort:
@@ -320,43 +371,11 @@ async def schedule_cohort(
                 groups=[],
             )
 
-        # Convert to Person objects for scheduling
-        people = []
-        user_id_map = {}  # discord_id -> user_id for later
-        facilitator_ids = set()
-        user_timezones = []  # Collect for DST warning check
-
-        for row in user_rows:
-            discord_id = row["discord_id"]
-            user_id_map[discord_id] = row["user_id"]
-            user_timezone = row["timezone"] or "UTC"
-
-            # Parse availability from JSON format, converting from local to UTC
-            intervals = availability_json_to_intervals(
-                row["availability_local"], user_timezone
-            )
-            if_needed = availability_json_to_intervals(
-                row["if_needed_availability_local"], user_timezone
-            )
-
-            if not intervals and not if_needed:
-                continue  # Skip users with no availability
-
-            name = (
-                row["nickname"] or row["discord_username"] or f"User {row['user_id']}"
-            )
-            person = Person(
-                id=discord_id,
-                name=name,
-                intervals=intervals,
-                if_needed_intervals=if_needed,
-                timezone=user_timezone,
-            )
-            people.append(person)
-            user_timezones.append(user_timezone)
-
-            if row["role"] == "facilitator":
-                facilitator_ids.add(discord_id)
+        # Parse availability and convert to UTC off the event loop: this is
+        # pure CPU work (one timezone conversion per slot range per user)
+        people, user_id_map, facilitator_ids, user_timezones = await asyncio.to_thread(
+            _build_people, user_rows
+        )
 
         # Query facilitator max_active_groups from facilitators table
         facilitator_max_groups = {}
@@ -1,15 +1,18 @@
 """Speech-to-text transcription using OpenAI Whisper API."""
 
 import os
+from typing import BinaryIO
 
 import httpx
 
 
-async def transcribe_audio(audio_bytes: bytes, filename: str) -> str:
+async def transcribe_audio(audio: bytes | BinaryIO, filename: str) -> str:
     """Transcribe audio using OpenAI Whisper API.
 
     Args:
-        audio_bytes: Raw audio file bytes (webm, mp3, wav, m4a, etc.)
+        audio: Raw audio bytes or a binary file object (webm, mp3, wav, m4a,
+            etc.). File objects are streamed in chunks rather than read
+            into memory up front.
         filename: Original filename with extension
 
     Returns:
@@ -26,7 +29,7 @@ async def transcribe_audio(audio_bytes: bytes, filename: str) -> str:
         response = await client.post(
             "https://api.openai.com/v1/audio/transcriptions",
             headers={"Authorization": f"Bearer {api_key}"},
-            files={"file": (filename, audio_bytes)},
+            files={"file": (filename, audio)},
             data={"model": "whisper-1"},
         )
         response.raise_for_status()
@@ -5,7 +5,21 @@ Timezone conversion utilities.
 from datetime import datetime
 import pytz
 
-from .constants import DAY_NAMES
+from .constants import DAY_INDEX, DAY_NAMES
+
+
+def _convert_day_hour(
+    day_name: str, hour: int, from_tz: pytz.BaseTzInfo, to_tz: pytz.BaseTzInfo
+) -> tuple:
+    """Convert a weekly day/hour from one timezone to another."""
+    # Map day to date (Jan 1, 2024 is Monday)
+    day_index = DAY_INDEX[day_name]
+
+    # Create datetime in the source timezone and convert
+    from_dt = from_tz.localize(datetime(2024, 1, 1 + day_index, hour, 0))
+    to_dt = from_dt.astimezone(to_tz)
+
+    return (DAY_NAMES[to_dt.weekday()], to_dt.hour)
 
 
 def local_to_utc_time(day_name: str, hour: int, user_tz_str: str) -> tuple:
@@ -20,18 +34,7 @@ def local_to_utc_time(day_name: str, hour: int, user_tz_str: str) -> tuple:
     Returns:
         Tuple of (utc_day_name, utc_hour)
     """
-    tz = pytz.timezone(user_tz_str)
-
-    # Map day to date (Jan 1, 2024 is Monday)
-    day_index = DAY_NAMES.index(day_name)
-
-    # Create local datetime
-    local_dt = tz.localize(datetime(2024, 1, 1 + day_index, hour, 0))
-
-    # Convert to UTC
-    utc_dt = local_dt.astimezone(pytz.UTC)
-
-    return (DAY_NAMES[utc_dt.weekday()], utc_dt.hour)
+    return _convert_day_hour(day_name, hour, pytz.timezone(user_tz_str), pytz.UTC)
 
 
 def utc_to_local_time(day_name: str, hour: int, user_tz_str: str) -> tuple:
@@ -46,15 +49,4 @@ def utc_to_local_time(day_name: str, hour: int, user_tz_str: str) -> tuple:
     Returns:
         Tuple of (local_day_name, local_hour)
     """
-    tz = pytz.timezone(user_tz_str)
-
-    # Map day to date (Jan 1, 2024 is Monday)
-    day_index = DAY_NAMES.index(day_name)
-
-    # Create UTC datetime
-    utc_dt = pytz.UTC.localize(datetime(2024, 1, 1 + day_index, hour, 0))
-
-    # Convert to local
-    local_dt = utc_dt.astimezone(tz)
-
-    return (DAY_NAMES[local_dt.weekday()], local_dt.hour)
+    return _convert_day_hour(day_name, hour, pytz.UTC, pytz.timezone(user_tz_str))
@@ -147,18 +147,19 @@ async def get_facilitators() -> list[dict[str, Any]]:
         return await user_queries.get_facilitators(conn)
 
 
-async def toggle_facilitator(discord_id: str) -> bool:
+async def toggle_facilitator(discord_id: str, user_id: int | None = None) -> bool:
     """
     Toggle a user's facilitator status.
 
     Args:
         discord_id: Discord user ID
+        user_id: Database user ID, if already loaded (skips the user lookup)
 
     Returns:
         New facilitator status (True/False), or False if user doesn't exist
     """
     async with get_transaction() as conn:
-        return await user_queries.toggle_facilitator(conn, discord_id)
+        return await user_queries.toggle_facilitator(conn, discord_id, user_id)
 
 
 async def is_facilitator(discord_id: str) -> bool:
@@ -10,11 +10,6 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from core import (
     get_user_profile,
     toggle_facilitator,
@@ -33,16 +28,20 @@ class EnrollmentCog(commands.Cog):
 
     def __init__(self, bot):
         self.bot = bot
+        self._facilitator_role_ids: dict[int, int] = {}  # guild_id -> role_id
 
     # TODO: Probably move this function or rename the class.
     @app_commands.command(name="signup", description="Sign up for the AI Safety course")
     async def signup(self, interaction: discord.Interaction):
         """Generate a web signup link with an auth code."""
+        # Ack before the DB write so a slow database can't miss the 3s deadline
+        await interaction.response.defer(ephemeral=True)
+
         discord_id = str(interaction.user.id)
         code = await create_auth_code(discord_id)
         link = _build_auth_link(code, "/signup")
 
-        await interaction.response.send_message(
+        await interaction.followup.send(
             f"Click here to sign up: {link}\n\nThis link expires in 5 minutes.",
             ephemeral=True,
         )
@@ -54,15 +53,30 @@ class EnrollmentCog(commands.Cog):
     @app_commands.checks.has_permissions(administrator=True)
     async def availability(self, interaction: discord.Interaction):
         """Generate a web link with an auth code to edit availability."""
+        await interaction.response.defer(ephemeral=True)
+
         discord_id = str(interaction.user.id)
         code = await create_auth_code(discord_id)
         link = _build_auth_link(code, "/availability")
 
-        await interaction.response.send_message(
+        await interaction.followup.send(
             f"Click here to view and edit your availability: {link}\n\nThis link expires in 5 minutes.",
             ephemeral=True,
         )
 
+    def _get_facilitator_role(self, guild: discord.Guild) -> discord.Role | None:
+        """Get the guild's Facilitator role, caching its ID per guild."""
+        role_id = self._facilitator_role_ids.get(guild.id)
+        if role_id is not None:
+            role = guild.get_role(role_id)
+            if role:
+                return role
+
+        role = discord.utils.get(guild.roles, name="Facilitator")
+        if role:
+            self._facilitator_role_ids[guild.id] = role.id
+        return role
+
     # TODO: Probably remove this command. I think it is an old trial that presumes facilitator privileges are set within the Discord guild, instead of in our DB.
     @app_commands.command(
         name="toggle-facilitator", description="Toggle your facilitator status"
@@ -71,25 +85,23 @@ class EnrollmentCog(commands.Cog):
     @app_commands.checks.has_permissions(administrator=True)
     async def toggle_facilitator_cmd(self, interaction: discord.Interaction):
         """Toggle whether you are marked as a facilitator."""
+        await interaction.response.defer(ephemeral=True)
+
         user_id = str(interaction.user.id)
         user_data = await get_user_profile(user_id)
 
         if not user_data:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 "You haven't signed up yet! Use `/signup` first.", ephemeral=True
             )
             return
 
-        await interaction.response.defer(ephemeral=True)
-
-        # Use core function to toggle (now async)
-        new_status = await toggle_facilitator(user_id)
+        # Reuse the profile loaded above instead of looking the user up again
+        new_status = await toggle_facilitator(user_id, user_data["user_id"])
 
         role_message = ""
         if interaction.guild:
-            facilitator_role = discord.utils.get(
-                interaction.guild.roles, name="Facilitator"
-            )
+            facilitator_role = self._get_facilitator_role(interaction.guild)
 
             if not facilitator_role:
                 try:
@@ -98,6 +110,9 @@ class EnrollmentCog(commands.Cog):
                         color=discord.Color.gold(),
                         reason="Created by scheduler bot",
                     )
+                    self._facilitator_role_ids[interaction.guild.id] = (
+                        facilitator_role.id
+                    )
                     role_message = "\n(Created Facilitator role)"
                 except discord.Forbidden:
                     role_message = (
@@ -10,11 +10,6 @@ from discord.ext import commands
 from datetime import datetime, timedelta
 import pytz
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from core.database import get_connection, get_transaction
 from core.queries.cohorts import get_realizable_cohorts, save_cohort_category_id
 from core.queries.groups import (
@@ -9,11 +9,6 @@ import os
 import discord
 from discord.ext import commands
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from core import get_user_nickname, update_user_nickname
 
 
@@ -2,15 +2,12 @@
 Scheduler Cog - Discord adapter for the scheduling algorithm.
 """
 
+import time
+
 import discord
 from discord import app_commands
 from discord.ext import commands
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from core import (
     schedule_cohort,
     CohortSchedulingResult,
@@ -18,6 +15,9 @@ from core import (
 from core.database import get_connection
 from core.queries.cohorts import get_schedulable_cohorts
 
+# Minimum seconds between progress message edits (Discord rate-limits edits)
+PROGRESS_UPDATE_INTERVAL = 1.0
+
 
 class SchedulerCog(commands.Cog):
     """Cog for cohort scheduling functionality."""
@@ -80,7 +80,19 @@ class SchedulerCog(commands.Cog):
             "Running scheduling algorithm...", ephemeral=False
         )
 
+        last_progress_update = 0.0
+
         async def update_progress(current, total, best_score, total_people):
+            nonlocal last_progress_update
+            # Coalesce rapid progress callbacks into at most one edit per interval
+            now = time.time()
+            if (
+                current < total
+                and now - last_progress_update < PROGRESS_UPDATE_INTERVAL
+            ):
+                return
+            last_progress_update = now
+
             try:
                 await progress_msg.edit(
                     content=f"Scheduling...\n"
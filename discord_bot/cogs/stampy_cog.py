@@ -13,11 +13,6 @@ import time
 import os
 import re
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from core import stampy
 
 ASK_STAMPY_CHANNEL = os.getenv("ASK_STAMPY_CHANNEL", "ask-stampy")
@@ -7,7 +7,9 @@ for AI safety education courses.
 """
 
 import os
+import sys
 import traceback
+from pathlib import Path
 
 import discord
 from discord.ext import commands
@@ -102,4 +104,10 @@ def main():
 
 
 if __name__ == "__main__":
+    # Standalone runs (`cd discord_bot && python main.py`) need the project root
+    # importable for `core`, which the cogs import when loaded in on_ready().
+    # The unified root main.py already sets this up.
+    project_root = str(Path(__file__).parent.parent)
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
     main()
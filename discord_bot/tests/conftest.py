@@ -4,7 +4,31 @@ Pytest fixtures for scheduler tests.
 
 import pytest_asyncio
 from dotenv import load_dotenv
-from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+
+
+class SavepointConnection(AsyncConnection):
+    """
+    AsyncConnection whose commit()/rollback() act on a SAVEPOINT.
+
+    Tests can call commit() on db_conn without ending the outer per-test
+    transaction: the current savepoint is released and a new one started,
+    so everything is still rolled back at teardown.
+    """
+
+    __slots__ = ()
+
+    async def commit(self) -> None:
+        nested = self.get_nested_transaction()
+        if nested is not None:
+            await nested.commit()
+        await self.begin_nested()
+
+    async def rollback(self) -> None:
+        nested = self.get_nested_transaction()
+        if nested is not None:
+            await nested.rollback()
+        await self.begin_nested()
 
 
 @pytest_asyncio.fixture
@@ -13,7 +37,8 @@ async def db_conn():
     Provide a DB connection that rolls back after each test.
 
     All changes made during the test are visible within the test,
-    but rolled back afterward so DB stays clean.
+    but rolled back afterward so DB stays clean. The test runs inside a
+    SAVEPOINT, so commit() on the connection doesn't escape the rollback.
 
     Creates a fresh engine per test to avoid event loop issues.
     """
@@ -31,8 +56,9 @@ async def db_conn():
         connect_args={"statement_cache_size": 0},
     )
 
-    async with engine.connect() as conn:
+    async with SavepointConnection(engine) as conn:
         txn = await conn.begin()
+        await conn.begin_nested()
         try:
             yield conn
         finally:
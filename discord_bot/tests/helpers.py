@@ -7,11 +7,6 @@ from datetime import date, timedelta
 from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncConnection
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from core.tables import cohorts, users, signups, groups, groups_users
 from core.enums import CohortRole, GroupUserRole, GroupUserStatus
 
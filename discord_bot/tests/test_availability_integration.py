@@ -7,11 +7,6 @@ Tests the full conversion pipeline WITHOUT running the actual scheduler.
 import pytest
 from sqlalchemy import insert, select
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from core.tables import users
 from core.availability import availability_json_to_intervals
 from core.queries.users import save_user_profile
@@ -5,11 +5,6 @@ from datetime import date, timedelta
 
 from sqlalchemy import insert
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from core.tables import cohorts, signups, users
 from core.queries.cohorts import get_available_cohorts
 from core.enums import CohortRole
@@ -34,7 +29,7 @@ class TestGetAvailableCohorts:
             )
             .returning(cohorts)
         )
-        future_cohort = dict(cohort_result.mappings().first())
+        future_cohort = cohort_result.mappings().first()
 
         # Create past cohort (should not appear)
         past_date = date.today() - timedelta(days=30)
@@ -79,7 +74,7 @@ class TestGetAvailableCohorts:
             )
             .returning(users)
         )
-        user = dict(user_result.mappings().first())
+        user = user_result.mappings().first()
 
         # Create two future cohorts
         future_date = date.today() + timedelta(days=30)
@@ -94,7 +89,7 @@ class TestGetAvailableCohorts:
             )
             .returning(cohorts)
         )
-        cohort1 = dict(cohort1_result.mappings().first())
+        cohort1 = cohort1_result.mappings().first()
 
         cohort2_result = await db_conn.execute(
             insert(cohorts)
@@ -107,7 +102,7 @@ class TestGetAvailableCohorts:
             )
             .returning(cohorts)
         )
-        cohort2 = dict(cohort2_result.mappings().first())
+        cohort2 = cohort2_result.mappings().first()
 
         # Sign up user for first cohort
         await db_conn.execute(
@@ -155,7 +150,7 @@ class TestIsFacilitatorByUserId:
             )
             .returning(users)
         )
-        user = dict(user_result.mappings().first())
+        user = user_result.mappings().first()
 
         result = await is_facilitator_by_user_id(db_conn, user["user_id"])
 
@@ -174,7 +169,7 @@ class TestIsFacilitatorByUserId:
             )
             .returning(users)
         )
-        user = dict(user_result.mappings().first())
+        user = user_result.mappings().first()
 
         await db_conn.execute(insert(facilitators).values(user_id=user["user_id"]))
 
@@ -205,9 +200,10 @@ class TestBecomeFacilitator:
             )
             .returning(users)
         )
-        user = dict(user_result.mappings().first())
+        user = user_result.mappings().first()
 
-        # Commit so become_facilitator can see the user
+        # db_conn.commit() only releases a savepoint (see conftest.py), so the
+        # user stays invisible to become_facilitator's own connection
         await db_conn.commit()
 
         result = await become_facilitator("new_fac")
@@ -226,6 +222,9 @@ class TestBecomeFacilitator:
            the global singleton engine from core.database.
         4. That singleton engine was created in a DIFFERENT event loop than the
            one running this test, causing "Future attached to a different loop".
+        5. Even with the loop issue fixed, db_conn.commit() only releases a
+           SAVEPOINT inside the test's outer transaction (see conftest.py), so
+           rows set up here are never visible to another connection.
 
         The core function works correctly in production (single event loop).
         The issue is purely test isolation - these "integration" functions don't
@@ -250,7 +249,7 @@ class TestBecomeFacilitator:
             )
             .returning(users)
         )
-        user = dict(user_result.mappings().first())
+        user = user_result.mappings().first()
 
         await db_conn.execute(insert(facilitators).values(user_id=user["user_id"]))
         await db_conn.commit()
@@ -286,7 +285,9 @@ class TestEnrollInCohort:
         This test fails because enroll_in_cohort() uses get_transaction() internally,
         which accesses the global singleton engine. The test fixture creates a fresh
         engine per test to avoid event loop conflicts, but the core function's engine
-        was created in a different event loop.
+        was created in a different event loop. db_conn.commit() also only releases
+        a SAVEPOINT, so the rows set up here never reach the core function's
+        connection.
 
         See test_returns_true_if_already_facilitator for detailed explanation.
         The core function works correctly in production (single event loop).
@@ -307,7 +308,7 @@ class TestEnrollInCohort:
             )
             .returning(cohorts)
         )
-        cohort = dict(cohort_result.mappings().first())
+        cohort = cohort_result.mappings().first()
 
         user_result = await db_conn.execute(
             insert(users)
@@ -350,7 +351,7 @@ class TestEnrollInCohort:
             )
             .returning(cohorts)
         )
-        cohort = dict(cohort_result.mappings().first())
+        cohort = cohort_result.mappings().first()
 
         await db_conn.execute(
             insert(users)
@@ -378,7 +379,9 @@ class TestEnrollInCohort:
         This test fails because enroll_in_cohort() uses get_transaction() internally,
         which accesses the global singleton engine. The test fixture creates a fresh
         engine per test to avoid event loop conflicts, but the core function's engine
-        was created in a different event loop.
+        was created in a different event loop. db_conn.commit() also only releases
+        a SAVEPOINT, so the rows set up here never reach the core function's
+        connection.
 
         See test_returns_true_if_already_facilitator for detailed explanation.
         The core function works correctly in production (single event loop).
@@ -408,7 +411,9 @@ class TestEnrollInCohort:
         This test fails because enroll_in_cohort() uses get_transaction() internally,
         which accesses the global singleton engine. The test fixture creates a fresh
         engine per test to avoid event loop conflicts, but the core function's engine
-        was created in a different event loop.
+        was created in a different event loop. db_conn.commit() also only releases
+        a SAVEPOINT, so the rows set up here never reach the core function's
+        connection.
 
         See test_returns_true_if_already_facilitator for detailed explanation.
         The core function works correctly in production (single event loop).
@@ -429,7 +434,7 @@ class TestEnrollInCohort:
             )
             .returning(cohorts)
         )
-        cohort = dict(cohort_result.mappings().first())
+        cohort = cohort_result.mappings().first()
         await db_conn.commit()
 
         result = await enroll_in_cohort(
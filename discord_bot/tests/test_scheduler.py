@@ -4,11 +4,6 @@ Tests the cohort_scheduler package integration.
 """
 
 import pytest
-import sys
-from pathlib import Path
-
-# Add project root to path so we can import from core
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 import cohort_scheduler
 from core import Person, DAY_MAP, calculate_total_available_time
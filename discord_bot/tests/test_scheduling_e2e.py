@@ -20,11 +20,8 @@ import os
 from dotenv import load_dotenv
 from sqlalchemy import select, delete
 
-import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from discord_bot.cogs.groups_cog import GroupsCog
 from .fake_interaction import FakeInteraction
 from .helpers import (
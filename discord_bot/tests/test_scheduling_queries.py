@@ -7,11 +7,6 @@ import pytest
 import pytest_asyncio
 from sqlalchemy import select, delete
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from core.queries.cohorts import (
     get_schedulable_cohorts,
     get_realizable_cohorts,
@@ -8,11 +8,6 @@ migrated to async database functions in core/enrollment.py.
 Use get_user_profile(), save_user_profile(), etc. instead.
 """
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 # Re-export from core for backward compatibility
 from core import (
     # Constants
@@ -97,6 +97,7 @@ from web_api.routes.speech import router as speech_router
 from web_api.routes.cohorts import router as cohorts_router
 from web_api.routes.courses import router as courses_router
 from web_api.routes.facilitator import router as facilitator_router
+from web_api.responses import ORJSONResponse
 
 # Track bot task for cleanup
 _bot_task: asyncio.Task | None = None
@@ -275,6 +276,7 @@ async def lifespan(app: FastAPI):
 app = FastAPI(
     title="AI Safety Course Platform API",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS configuration (uses centralized config from core/)
@@ -11,17 +11,13 @@ Endpoints:
 
 import os
 import secrets
-import sys
 import time
-from pathlib import Path
 from urllib.parse import urlencode
 
 import httpx
 from fastapi import APIRouter, HTTPException, Request, Response
 from fastapi.responses import RedirectResponse
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from core import get_or_create_user, get_user_profile, validate_and_use_auth_code
 from core.database import get_connection
 from core.queries.users import get_user_enrollment_status
@@ -5,14 +5,10 @@ Endpoints:
 - GET /api/cohorts/available - Get cohorts available for enrollment
 """
 
-import sys
-from pathlib import Path
 from typing import Any
 
 from fastapi import APIRouter, Depends
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from core.database import get_connection
 from core.queries.cohorts import get_available_cohorts
 from core.queries.users import get_user_by_discord_id
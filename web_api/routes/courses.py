@@ -12,17 +12,22 @@ from core.lessons.course_loader import (
 )
 from core.lessons.types import LessonRef, Meeting
 from core.lessons import (
-    load_lesson,
+    load_lessons_bulk,
     get_user_lesson_progress,
-    get_stage_title,
-    get_stage_duration,
-    LessonNotFoundError,
+    get_stage_summaries,
 )
 from web_api.auth import get_optional_user
 from core import get_or_create_user
 
 router = APIRouter(prefix="/api/courses", tags=["courses"])
 
+# Progress reported for lessons the user hasn't started (read-only, shared)
+NOT_STARTED_PROGRESS = {
+    "status": "not_started",
+    "current_stage_index": None,
+    "session_id": None,
+}
+
 
 @router.get("/{course_slug}/next-lesson")
 async def get_next_lesson_endpoint(
@@ -60,22 +65,21 @@ async def get_course_progress(course_slug: str, request: Request):
 
     Returns course modules, lessons, and stages with completion status.
     """
-    # Get user if authenticated
-    user_jwt = await get_optional_user(request)
-    user_id = None
-    if user_jwt:
-        discord_id = user_jwt["sub"]
-        user = await get_or_create_user(discord_id)
-        user_id = user["user_id"]
-
-    # Load course structure
+    # Load course structure first so unknown courses 404 without touching the DB
     try:
         course = load_course(course_slug)
     except CourseNotFoundError:
         raise HTTPException(status_code=404, detail=f"Course not found: {course_slug}")
 
-    # Get user's progress
-    progress = await get_user_lesson_progress(user_id)
+    # Get user's progress if authenticated; anonymous visitors have none
+    progress = {}
+    user_jwt = await get_optional_user(request)
+    if user_jwt:
+        user = await get_or_create_user(user_jwt["sub"])
+        progress = await get_user_lesson_progress(user["user_id"])
+
+    # Load every lesson in the course up front rather than one per loop iteration
+    lessons_by_slug = load_lessons_bulk([item.slug for item in get_lessons(course)])
 
     # Build units by splitting progression on Meeting objects
     units = []
@@ -95,39 +99,18 @@ async def get_course_progress(course_slug: str, request: Request):
                 current_lessons = []
             current_meeting_number = item.number
         elif isinstance(item, LessonRef):
-            # Load lesson details
-            try:
-                lesson = load_lesson(item.slug)
-            except LessonNotFoundError:
+            lesson = lessons_by_slug.get(item.slug)
+            if lesson is None:
                 continue
 
-            lesson_progress = progress.get(
-                item.slug,
-                {
-                    "status": "not_started",
-                    "current_stage_index": None,
-                    "session_id": None,
-                },
-            )
-
-            # Build stages info
-            stages = []
-            for stage in lesson.stages:
-                stages.append(
-                    {
-                        "type": stage.type,
-                        "title": get_stage_title(stage),
-                        "duration": get_stage_duration(stage) or None,
-                        "optional": getattr(stage, "optional", False),
-                    }
-                )
+            lesson_progress = progress.get(item.slug, NOT_STARTED_PROGRESS)
 
             current_lessons.append(
                 {
                     "slug": lesson.slug,
                     "title": lesson.title,
                     "optional": item.optional,
-                    "stages": stages,
+                    "stages": get_stage_summaries(lesson),
                     "status": lesson_progress["status"],
                     "currentStageIndex": lesson_progress["current_stage_index"],
                     "sessionId": lesson_progress["session_id"],
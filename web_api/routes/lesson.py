@@ -5,22 +5,30 @@ Endpoints:
 - POST /api/chat/lesson - Send message and stream response
 """
 
-import json
-import sys
-from pathlib import Path
+import asyncio
+from typing import AsyncIterator
 
+import orjson
 from fastapi import APIRouter, Depends
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from core.lessons.chat import send_message
 from core.lessons.types import ChatStage
 from web_api.auth import get_current_user
 
 router = APIRouter(prefix="/api/chat", tags=["lesson"])
 
+# SSE framing, kept as bytes so events need no str -> bytes round trip
+SSE_PREFIX = b"data: "
+SSE_SUFFIX = b"\n\n"
+SSE_DONE_EVENT = b'data: {"type":"done"}\n\n'
+
+# Text deltas are merged into one event until this many characters are
+# buffered or no new delta has arrived for this long
+COALESCE_MAX_CHARS = 256
+COALESCE_MAX_DELAY = 0.02  # seconds
+
 
 class ChatMessage(BaseModel):
     """A single chat message."""
@@ -36,6 +44,68 @@ class LessonChatRequest(BaseModel):
     system_context: str | None = None
 
 
+async def coalesce_text_chunks(
+    chunks: AsyncIterator[dict],
+    max_chars: int = COALESCE_MAX_CHARS,
+    max_delay: float = COALESCE_MAX_DELAY,
+) -> AsyncIterator[dict]:
+    """
+    Merge runs of consecutive text chunks into fewer, larger chunks.
+
+    Buffered text is flushed when it reaches max_chars, when no chunk has
+    arrived for max_delay seconds, before any non-text chunk, and at the end
+    of the stream. Non-text chunks pass through unchanged and in order.
+    """
+    pending: list[str] = []
+    pending_chars = 0
+
+    def flush() -> dict:
+        nonlocal pending, pending_chars
+        chunk = {"type": "text", "content": "".join(pending)}
+        pending, pending_chars = [], 0
+        return chunk
+
+    iterator = aiter(chunks)
+    next_chunk = asyncio.ensure_future(anext(iterator))
+    try:
+        while True:
+            # Only wait with a timeout while there is text to flush; a timed
+            # out wait leaves next_chunk running so no chunk is lost
+            done, _ = await asyncio.wait(
+                {next_chunk}, timeout=max_delay if pending else None
+            )
+            if not done:
+                yield flush()
+                continue
+
+            try:
+                chunk = next_chunk.result()
+            except StopAsyncIteration:
+                break
+            except Exception:
+                # Deliver text received before the failure, then propagate
+                if pending:
+                    yield flush()
+                raise
+            next_chunk = asyncio.ensure_future(anext(iterator))
+
+            if chunk.get("type") == "text":
+                pending.append(chunk["content"])
+                pending_chars += len(chunk["content"])
+                if pending_chars >= max_chars:
+                    yield flush()
+                continue
+
+            if pending:
+                yield flush()
+            yield chunk
+
+        if pending:
+            yield flush()
+    finally:
+        next_chunk.cancel()
+
+
 async def event_generator(messages: list[dict], system_context: str | None):
     """Generate SSE events from Claude stream."""
     # Create a ChatStage with the system_context as instructions
@@ -44,11 +114,13 @@ async def event_generator(messages: list[dict], system_context: str | None):
         instructions=system_context or "Help the user learn about AI safety.",
     )
     try:
-        async for chunk in send_message(messages, stage, None, None):
-            yield f"data: {json.dumps(chunk)}\n\n"
+        stream = send_message(messages, stage, None, None)
+        async for chunk in coalesce_text_chunks(stream):
+            yield SSE_PREFIX + orjson.dumps(chunk) + SSE_SUFFIX
     except Exception as e:
-        yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
-        yield f"data: {json.dumps({'type': 'done'})}\n\n"
+        error = {"type": "error", "message": str(e)}
+        yield SSE_PREFIX + orjson.dumps(error) + SSE_SUFFIX
+        yield SSE_DONE_EVENT
 
 
 @router.post("/lesson")
@@ -13,16 +13,12 @@ Endpoints:
 """
 
 import json
-import sys
-from pathlib import Path
 
 from fastapi import APIRouter, HTTPException, Depends, Request
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from sqlalchemy import insert
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from core.lessons import (
     load_lesson,
     get_available_lessons,
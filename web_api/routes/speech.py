@@ -8,6 +8,7 @@ from web_api.auth import get_optional_user
 router = APIRouter(prefix="/api", tags=["speech"])
 
 MAX_FILE_SIZE = 25 * 1024 * 1024  # 25MB (Whisper API limit)
+READ_CHUNK_SIZE = 64 * 1024
 
 
 @router.post("/transcribe")
@@ -16,16 +17,21 @@ async def transcribe(audio: UploadFile, user: dict | None = Depends(get_optional
     Accepts audio files in webm, mp3, wav, m4a, flac, ogg formats.
     Returns the transcribed text.
     """
-    contents = await audio.read()
-
-    if len(contents) > MAX_FILE_SIZE:
-        raise HTTPException(413, "File too large (max 25MB)")
-
-    if not contents:
+    # Check the size in chunks so oversize uploads are rejected without
+    # holding the whole file in memory
+    size = 0
+    while chunk := await audio.read(READ_CHUNK_SIZE):
+        size += len(chunk)
+        if size > MAX_FILE_SIZE:
+            raise HTTPException(413, "File too large (max 25MB)")
+
+    if not size:
         raise HTTPException(400, "Empty audio file")
 
+    await audio.seek(0)
+
     try:
-        text = await transcribe_audio(contents, audio.filename or "audio.webm")
+        text = await transcribe_audio(audio.file, audio.filename or "audio.webm")
         return {"text": text}
     except ValueError as e:
         # Missing API key
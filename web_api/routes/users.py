@@ -7,15 +7,11 @@ Endpoints:
 - POST /api/users/me/become-facilitator - Add user to facilitators table
 """
 
-import sys
-from pathlib import Path
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from core import update_user_profile, enroll_in_cohort
 from core import become_facilitator as core_become_facilitator
 from core.database import get_connection
@@ -5,148 +5,218 @@ These tests dynamically discover course structure rather than hardcoding
 specific lesson names. This makes tests resilient to content changes.
 """
 
-import sys
-from pathlib import Path
-
-# Ensure we import from root main.py, not web_api/main.py
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+import asyncio
+from typing import NamedTuple
 
+import httpx
 import pytest
-from fastapi.testclient import TestClient
-from main import app
+from pydantic import BaseModel, Field, TypeAdapter
 from core.lessons.course_loader import load_course, get_all_lesson_slugs
-from core.lessons.types import LessonRef, Meeting
+from core.lessons.types import Course, LessonRef, Meeting
+from main import app
 
-client = TestClient(app)
+pytestmark = pytest.mark.course_api
 
+# --- Fixtures for dynamic course discovery ---
 
-# --- Helper functions for dynamic course discovery ---
 
+@pytest.fixture(scope="session")
+def default_course() -> Course:
+    """The default course, loaded once for the whole session."""
+    return load_course("default")
 
-def get_first_lesson_before_meeting(course_slug: str) -> str | None:
-    """Find first lesson that's followed by a meeting."""
-    course = load_course(course_slug)
-    for i, item in enumerate(course.progression[:-1]):
-        if isinstance(item, LessonRef) and isinstance(course.progression[i + 1], Meeting):
-            return item.slug
-    return None
 
+class ProgressionLandmarks(NamedTuple):
+    """Lesson slugs in the default course that exercise each next-lesson case."""
 
-def get_first_lesson_before_lesson(course_slug: str) -> str | None:
-    """Find first lesson that's followed by another lesson."""
-    course = load_course(course_slug)
-    for i, item in enumerate(course.progression[:-1]):
-        if isinstance(item, LessonRef) and isinstance(course.progression[i + 1], LessonRef):
-            return item.slug
-    return None
+    first_before_meeting: str | None  # First lesson followed by a meeting
+    first_before_lesson: str | None  # First lesson followed by another lesson
+    last_lesson: str | None  # Last lesson in the course
 
 
-def get_last_lesson(course_slug: str) -> str | None:
-    """Find the last lesson in the course."""
-    course = load_course(course_slug)
-    for item in reversed(course.progression):
-        if isinstance(item, LessonRef):
-            return item.slug
-    return None
+def find_progression_landmarks(course: Course) -> ProgressionLandmarks:
+    """Find all landmark lessons in a single pass over the progression."""
+    progression = course.progression
+    first_before_meeting = first_before_lesson = last_lesson = None
 
+    # Classify each item once; the scan then compares each item's kind with
+    # the next one's instead of re-running isinstance on both
+    kinds = [type(item) for item in progression]
+    last_index = len(kinds) - 1
+    for i, kind in enumerate(kinds):
+        if kind is not LessonRef:
+            continue
+        next_kind = kinds[i + 1] if i < last_index else None
+        last_lesson = progression[i].slug
+        if first_before_meeting is None and next_kind is Meeting:
+            first_before_meeting = last_lesson
+        if first_before_lesson is None and next_kind is LessonRef:
+            first_before_lesson = last_lesson
 
-# --- API Tests ---
+    return ProgressionLandmarks(first_before_meeting, first_before_lesson, last_lesson)
 
 
-def test_get_next_lesson_returns_unit_complete():
-    """Should return completedUnit when next item is a meeting."""
-    lesson_slug = get_first_lesson_before_meeting("default")
-    if lesson_slug is None:
-        pytest.skip("No lesson→meeting pattern in default course")
+@pytest.fixture(scope="session")
+def progression_landmarks(default_course: Course) -> ProgressionLandmarks:
+    """Landmark lessons of the default course."""
+    return find_progression_landmarks(default_course)
 
-    response = client.get(f"/api/courses/default/next-lesson?current={lesson_slug}")
-    assert response.status_code == 200
-    data = response.json()
-    assert "completedUnit" in data
-    assert isinstance(data["completedUnit"], int)
 
+# Expected next-lesson response fields after each landmark
+NEXT_LESSON_CASES = {
+    # Next item is a meeting -> unit boundary
+    "first_before_meeting": {"completedUnit": int},
+    # Next item is a lesson -> next lesson info
+    "first_before_lesson": {"nextLessonSlug": str, "nextLessonTitle": str},
+    # Last lesson returns either unit_complete (if followed by meeting)
+    # or could potentially return null/empty for course end
+    "last_lesson": {},
+}
 
-def test_get_next_lesson_returns_lesson():
-    """Should return next lesson info when no meeting in between."""
-    lesson_slug = get_first_lesson_before_lesson("default")
-    if lesson_slug is None:
-        pytest.skip("No lesson→lesson pattern in default course")
 
-    response = client.get(f"/api/courses/default/next-lesson?current={lesson_slug}")
-    assert response.status_code == 200
-    data = response.json()
-    assert "nextLessonSlug" in data
-    assert "nextLessonTitle" in data
-    assert isinstance(data["nextLessonSlug"], str)
-    assert isinstance(data["nextLessonTitle"], str)
+def pytest_generate_tests(metafunc):
+    """Parametrize next-lesson tests with the landmarks the course actually has.
+
+    Runs at collection time, so a course lacking a landmark yields no test
+    for it rather than a test that skips itself.
+    """
+    if "landmark_slug" not in metafunc.fixturenames:
+        return
+    landmarks = find_progression_landmarks(load_course("default"))
+    present = {
+        name: slug for name, slug in landmarks._asdict().items() if slug is not None
+    }
+    metafunc.parametrize(
+        "landmark_slug, expected_types",
+        [(slug, NEXT_LESSON_CASES[name]) for name, slug in present.items()],
+        ids=list(present),
+    )
+
+
+# --- Batched API requests ---
+
+
+def progress_url(course_slug: str) -> str:
+    return f"/api/courses/{course_slug}/progress"
+
+
+def next_lesson_url(course_slug: str, lesson_slug: str) -> str:
+    return f"/api/courses/{course_slug}/next-lesson?current={lesson_slug}"
+
+
+@pytest.fixture(scope="session")
+def api_responses(progression_landmarks: ProgressionLandmarks) -> dict:
+    """
+    Fetch every URL these tests check concurrently, once per session.
+
+    Returns a dict mapping URL to response. Goes through httpx's ASGI
+    transport directly, which (like the shared TestClient) skips the app
+    lifespan, so no database or Discord bot is needed.
+    """
+    urls = [
+        progress_url("default"),
+        progress_url("nonexistent"),
+        next_lesson_url("nonexistent", "any-lesson"),
+        next_lesson_url("default", "nonexistent-lesson"),
+    ]
+    urls += [next_lesson_url("default", slug) for slug in progression_landmarks if slug]
+
+    async def fetch_all():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+            responses = await asyncio.gather(*(ac.get(url) for url in urls))
+        return dict(zip(urls, responses))
+
+    return asyncio.run(fetch_all())
+
+
+# --- Response schemas ---
+# The routes return plain dicts, so these strict models stand in for the
+# per-field isinstance checks (strict: no coercing "1" to 1 or 1 to True)
 
 
-def test_get_next_lesson_end_of_course():
-    """Should return appropriate response for last lesson."""
-    last_lesson = get_last_lesson("default")
-    if last_lesson is None:
-        pytest.skip("No lessons found in default course")
+class ProgressLesson(BaseModel, strict=True):
+    slug: str
+    title: str
+    optional: bool
 
-    response = client.get(f"/api/courses/default/next-lesson?current={last_lesson}")
+
+class ProgressUnit(BaseModel, strict=True):
+    meetingNumber: int
+    lessons: list[dict] = Field(min_length=1)  # Lesson fields checked separately
+
+
+class ProgressCourse(BaseModel, strict=True):
+    slug: str
+    title: str = Field(min_length=1)
+
+
+# Built once at import; each validates a whole list in a single call
+units_adapter = TypeAdapter(list[ProgressUnit])
+lessons_adapter = TypeAdapter(list[ProgressLesson])
+
+
+# --- API Tests ---
+
+
+def test_get_next_lesson(api_responses, landmark_slug, expected_types):
+    """Should describe what follows each kind of lesson in the progression."""
+    response = api_responses[next_lesson_url("default", landmark_slug)]
     assert response.status_code == 200
-    # Last lesson returns either unit_complete (if followed by meeting)
-    # or could potentially return null/empty for course end
+    if expected_types:
+        data = response.json()
+        for key, expected_type in expected_types.items():
+            assert isinstance(data[key], expected_type)
 
 
-def test_get_next_lesson_invalid_course():
+def test_get_next_lesson_invalid_course(api_responses):
     """Should return 404 for invalid course."""
-    response = client.get("/api/courses/nonexistent/next-lesson?current=any-lesson")
+    response = api_responses[next_lesson_url("nonexistent", "any-lesson")]
     assert response.status_code == 404
 
 
-def test_get_next_lesson_invalid_lesson():
+def test_get_next_lesson_invalid_lesson(api_responses):
     """Should return 204 No Content for lesson not in course (same as end of course)."""
-    response = client.get("/api/courses/default/next-lesson?current=nonexistent-lesson")
+    response = api_responses[next_lesson_url("default", "nonexistent-lesson")]
     # API returns 204 No Content when lesson not found in course
     # (same behavior as reaching end of course)
     assert response.status_code == 204
 
 
-def test_get_course_progress_returns_units():
-    """Should return course progress with units."""
-    response = client.get("/api/courses/default/progress")
+@pytest.fixture(scope="session")
+def progress_payload(api_responses) -> dict:
+    """Anonymous /progress response for the default course, decoded once."""
+    response = api_responses[progress_url("default")]
     assert response.status_code == 200
-    data = response.json()
-
-    # Should have course info
-    assert "course" in data
-    assert "slug" in data["course"]
-    assert "title" in data["course"]
-    assert data["course"]["slug"] == "default"
-    assert isinstance(data["course"]["title"], str)
-    assert len(data["course"]["title"]) > 0
-
-    # Should have units, not modules
-    assert "units" in data
-    assert "modules" not in data
-
-    # Should have at least one unit
-    assert len(data["units"]) >= 1
-
-    # First unit should have expected structure
-    unit = data["units"][0]
-    assert "meetingNumber" in unit
-    assert isinstance(unit["meetingNumber"], int)
-    assert "lessons" in unit
-    assert len(unit["lessons"]) >= 1
-
-    # Each lesson should have required fields
-    lesson = unit["lessons"][0]
-    assert "slug" in lesson
-    assert "title" in lesson
-    assert "optional" in lesson
-    assert isinstance(lesson["slug"], str)
-    assert isinstance(lesson["title"], str)
-    assert isinstance(lesson["optional"], bool)
-
-
-def test_get_course_progress_invalid_course():
+    return response.json()
+
+
+def test_get_course_progress_returns_course(progress_payload):
+    """Should return course info."""
+    course = ProgressCourse.model_validate(progress_payload["course"])
+    assert course.slug == "default"
+
+
+def test_get_course_progress_returns_units(progress_payload):
+    """Should return at least one unit, not modules."""
+    assert "modules" not in progress_payload
+    assert len(progress_payload["units"]) >= 1
+
+
+def test_get_course_progress_unit_structure(progress_payload):
+    """Every unit should have a meeting number and lessons."""
+    units_adapter.validate_python(progress_payload["units"])
+
+
+def test_get_course_progress_lesson_fields(progress_payload):
+    """Each lesson should have required fields."""
+    lessons = [
+        lesson for unit in progress_payload["units"] for lesson in unit["lessons"]
+    ]
+    lessons_adapter.validate_python(lessons)
+
+
+def test_get_course_progress_invalid_course(api_responses):
     """Should return 404 for invalid course."""
-    response = client.get("/api/courses/nonexistent/progress")
+    response = api_responses[progress_url("nonexistent")]
     assert response.status_code == 404
@@ -0,0 +1,59 @@
+# web_api/tests/test_lesson_chat.py
+"""Tests for lesson chat SSE helpers."""
+
+import asyncio
+
+import pytest
+
+from web_api.routes.lesson import coalesce_text_chunks
+
+
+async def _collect(chunks):
+    return [chunk async for chunk in coalesce_text_chunks(chunks)]
+
+
+async def test_merges_consecutive_text_chunks():
+    """Text deltas should be merged, with other events kept in order."""
+
+    async def stream():
+        yield {"type": "text", "content": "Hel"}
+        yield {"type": "text", "content": "lo"}
+        yield {"type": "tool_use", "name": "transition_to_video"}
+        yield {"type": "text", "content": "!"}
+        yield {"type": "done"}
+
+    assert await _collect(stream()) == [
+        {"type": "text", "content": "Hello"},
+        {"type": "tool_use", "name": "transition_to_video"},
+        {"type": "text", "content": "!"},
+        {"type": "done"},
+    ]
+
+
+async def test_flushes_text_when_stream_pauses():
+    """Buffered text should be sent once the stream goes quiet."""
+
+    async def stream():
+        yield {"type": "text", "content": "first"}
+        await asyncio.sleep(0.1)
+        yield {"type": "text", "content": "second"}
+
+    assert await _collect(stream()) == [
+        {"type": "text", "content": "first"},
+        {"type": "text", "content": "second"},
+    ]
+
+
+async def test_flushes_text_before_propagating_errors():
+    """Text received before a failure should not be dropped."""
+
+    async def stream():
+        yield {"type": "text", "content": "partial"}
+        raise ValueError("boom")
+
+    received = []
+    with pytest.raises(ValueError):
+        async for chunk in coalesce_text_chunks(stream()):
+            received.append(chunk)
+
+    assert received == [{"type": "text", "content": "partial"}]
@@ -1,27 +1,14 @@
 # web_api/tests/test_lessons_api.py
 """Tests for lesson API endpoints."""
 
-import sys
-from pathlib import Path
-
-# Ensure we import from root main.py, not web_api/main.py
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
-
 import pytest
-from fastapi.testclient import TestClient
 from unittest.mock import patch, AsyncMock
 
-from main import app
-
-
-client = TestClient(app)
-
 
 # --- Task 4: Claim Endpoint Tests ---
 
 
-def test_claim_session_success():
+def test_claim_session_success(client):
     """Authenticated user can claim an anonymous session."""
     # Mock the auth to return a user
     with patch("web_api.routes.lessons.get_current_user") as mock_auth:
@@ -50,7 +37,7 @@ def test_claim_session_success():
                 mock_claim.assert_called_once_with(1, 42)
 
 
-def test_claim_session_requires_auth():
+def test_claim_session_requires_auth(client):
     """Cannot claim a session without authentication."""
     from fastapi import HTTPException
 
@@ -65,7 +52,7 @@ def test_claim_session_requires_auth():
         assert response.status_code == 401
 
 
-def test_claim_already_claimed_session():
+def test_claim_already_claimed_session(client):
     """Cannot claim a session that's already claimed."""
     with patch("web_api.routes.lessons.get_current_user") as mock_auth:
         mock_auth.return_value = {"sub": "test_discord_123", "username": "testuser"}
@@ -86,7 +73,7 @@ def test_claim_already_claimed_session():
                 assert response.status_code == 403
 
 
-def test_claim_nonexistent_session():
+def test_claim_nonexistent_session(client):
     """Cannot claim a session that doesn't exist."""
     with patch("web_api.routes.lessons.get_current_user") as mock_auth:
         mock_auth.return_value = {"sub": "test_discord_123", "username": "testuser"}
@@ -110,7 +97,7 @@ def test_claim_nonexistent_session():
 # --- Task 5: Anonymous Session Access Tests ---
 
 
-def test_get_anonymous_session_by_id():
+def test_get_anonymous_session_by_id(client):
     """Can access an anonymous session without auth if you have the session_id."""
     with patch("web_api.routes.lessons.get_optional_user") as mock_auth:
         mock_auth.return_value = None  # Not authenticated
@@ -148,7 +135,7 @@ def test_get_anonymous_session_by_id():
                     assert response.status_code == 200
 
 
-def test_get_session_forbidden_for_wrong_user():
+def test_get_session_forbidden_for_wrong_user(client):
     """Cannot access another user's session."""
     with patch("web_api.routes.lessons.get_optional_user") as mock_auth:
         mock_auth.return_value = {"sub": "test_discord_123", "username": "testuser"}
@@ -178,7 +165,7 @@ def test_get_session_forbidden_for_wrong_user():
 # --- Task 6: Anonymous Session Creation Tests ---
 
 
-def test_create_anonymous_session():
+def test_create_anonymous_session(client):
     """Can create a session without authentication."""
     with patch("web_api.routes.lessons.get_optional_user") as mock_auth:
         mock_auth.return_value = None  # Not authenticated
@@ -208,7 +195,7 @@ def test_create_anonymous_session():
                 mock_create.assert_called_once_with(None, "intro-to-ai-safety")
 
 
-def test_create_authenticated_session():
+def test_create_authenticated_session(client):
     """Authenticated user creates session with their user_id."""
     with patch("web_api.routes.lessons.get_optional_user") as mock_auth:
         mock_auth.return_value = {"sub": "test_discord_123", "username": "testuser"}
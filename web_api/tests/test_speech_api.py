@@ -0,0 +1,52 @@
+# web_api/tests/test_speech_api.py
+"""Tests for the speech-to-text upload endpoint."""
+
+from unittest.mock import patch
+
+
+def test_transcribe_sends_full_upload(client):
+    """The size check reads the upload; it must be rewound before sending."""
+    payload = bytes(range(256)) * 1024  # 256KB: several read chunks
+    received = {}
+
+    async def fake_transcribe(audio, filename):
+        received["data"] = audio.read()
+        received["filename"] = filename
+        return "hello world"
+
+    with patch("web_api.routes.speech.transcribe_audio", side_effect=fake_transcribe):
+        response = client.post(
+            "/api/transcribe",
+            files={"audio": ("clip.webm", payload, "audio/webm")},
+        )
+
+    assert response.status_code == 200
+    assert response.json() == {"text": "hello world"}
+    assert received["data"] == payload
+    assert received["filename"] == "clip.webm"
+
+
+def test_transcribe_rejects_empty_upload(client):
+    """An empty upload should return 400 without calling the API."""
+    with patch("web_api.routes.speech.transcribe_audio") as mock_transcribe:
+        response = client.post(
+            "/api/transcribe",
+            files={"audio": ("clip.webm", b"", "audio/webm")},
+        )
+
+    assert response.status_code == 400
+    mock_transcribe.assert_not_called()
+
+
+def test_transcribe_rejects_oversize_upload(client, monkeypatch):
+    """An upload over MAX_FILE_SIZE should return 413 without calling the API."""
+    monkeypatch.setattr("web_api.routes.speech.MAX_FILE_SIZE", 1024)
+
+    with patch("web_api.routes.speech.transcribe_audio") as mock_transcribe:
+        response = client.post(
+            "/api/transcribe",
+            files={"audio": ("clip.webm", b"x" * 2048, "audio/webm")},
+        )
+
+    assert response.status_code == 413
+    mock_transcribe.assert_not_called()